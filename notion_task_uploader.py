@@ -15,17 +15,64 @@ Example:
 import argparse
 import asyncio
 import csv
+import hashlib
 import httpx
+import logging
+import orjson
 import os
+import re
 import sys
-from datetime import datetime
-from typing import List, Dict, Any, Optional, Set
+from collections import Counter
+from datetime import date
+from itertools import chain, repeat
+from typing import AsyncIterator, Awaitable, Collection, Iterator, List, Dict, Any, Optional, Sequence, Tuple
+from urllib.parse import unquote
+
+try:
+    # Optional faster event loop; not available on Windows
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    # Optional vectorized CSV parser used for large input files
+    import pandas as pd
+except ImportError:
+    pd = None
+
+logger = logging.getLogger(__name__)
 
 # Notion API configuration
 NOTION_API_KEY = os.environ.get("NOTION_API_KEY")
 NOTION_DATABASE_ID = os.environ.get("NOTION_DATABASE_ID")
 NOTION_API_BASE_URL = "https://api.notion.com/v1"
 
+# Maximum number of in-flight requests per endpoint (Notion allows ~3 requests
+# per second); creates and updates run in separate waves and are tuned separately
+NOTION_CREATE_CONCURRENCY = 3
+NOTION_UPDATE_CONCURRENCY = 3
+
+# Retry policy for rate-limited (429) and transient server errors
+NOTION_MAX_RETRIES = 5
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+# Page creation isn't idempotent: a 500/502/504 may arrive after the page was
+# created, so only retry responses that were rejected before processing
+CREATE_RETRY_STATUS_CODES = {429, 503}
+
+# Number of results requested per database query page (Notion's maximum)
+NOTION_PAGE_SIZE = 100
+
+# Notion rejects text objects longer than this many characters
+NOTION_MAX_TEXT_LENGTH = 2000
+
+# CSV files at least this large are parsed with pandas (when installed), in
+# chunks of PANDAS_CHUNK_SIZE rows
+PANDAS_MIN_FILE_SIZE = 8 * 1024 * 1024
+PANDAS_CHUNK_SIZE = 10_000
+
+# Seconds between progress log lines while uploading
+PROGRESS_INTERVAL = 1.0
+
 # Mapping for standardized column names across different CSV formats
 COLUMN_MAPPING = {
     # Original CSV column name -> Standardized column name
@@ -43,6 +90,100 @@ COLUMN_MAPPING = {
     "Estimated Effort": "Estimated Effort"
 }
 
+# Notion properties written by this script, compared when skipping no-op updates
+MANAGED_PROPERTIES = set(COLUMN_MAPPING.values())
+
+# Accepted Due Date formats: ISO dates (optionally with a time) and MM/DD/YYYY
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:\d{2})?)?$")
+_US_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})$")
+
+def _norm(name: str) -> str:
+    """Normalize a task name so case and whitespace differences still match"""
+    return " ".join(name.lower().split())
+
+def _text_objects(value: str) -> List[Dict[str, Any]]:
+    """Split text into Notion text objects that respect the per-object length limit"""
+    return [
+        {"text": {"content": value[i:i + NOTION_MAX_TEXT_LENGTH]}}
+        for i in range(0, len(value), NOTION_MAX_TEXT_LENGTH)
+    ] or [{"text": {"content": ""}}]
+
+def _normalize_date(value: str) -> Optional[str]:
+    """Normalize a date to ISO format (YYYY-MM-DD), or return None if it isn't a recognized date"""
+    value = value.strip()
+    try:
+        if _ISO_DATE_RE.match(value):
+            # Validate the date part; any time suffix is kept as given
+            date.fromisoformat(value[:10])
+            return value
+        match = _US_DATE_RE.match(value)
+        if not match:
+            return None
+        month, day, year = match.groups()
+        return date(int(year), int(month), int(day)).isoformat()
+    except ValueError:
+        # Out-of-range month or day
+        return None
+
+def _build_date(value: str) -> Optional[Dict[str, Any]]:
+    """Build a date property from a normalized date"""
+    start = _normalize_date(value)
+    if start is None:
+        # If date parsing fails, don't add the property
+        return None
+    return {"date": {"start": start}}
+
+# Notion property type -> builder for a property value of that type
+_BUILDERS = {
+    "title": lambda value: {"title": _text_objects(value)},
+    "rich_text": lambda value: {"rich_text": _text_objects(value)},
+    "select": lambda value: {"select": {"name": value}},
+    "date": _build_date
+}
+
+# (standardized task key, Notion property, Notion type, default) for non-title properties
+_FIELDS = [
+    ("Sprint", "Sprint", "rich_text", None),
+    ("Task Description", "Task Description", "rich_text", None),
+    ("Tools/APIs Required", "Tools/APIs Required", "rich_text", None),
+    ("API/Tokens Required", "API/Tokens Required", "rich_text", None),
+    ("Status", "Status", "select", "Not Started"),
+    ("Priority", "Priority", "select", "Normal"),
+    ("Due Date", "Due Date", "date", None),
+    ("Estimated Effort", "Estimated Effort", "select", None),
+    ("Dependencies", "Dependencies", "rich_text", None),
+    ("Notes/Comments", "Notes/Comments", "rich_text", None)
+]
+
+# Every property a task can produce, in payload order; copied per task so the
+# dict is created at its final size
+_TEMPLATE = dict.fromkeys(["Category", *(notion_field for _, notion_field, _, _ in _FIELDS)])
+
+def _hash_properties(properties: Dict[str, Any]) -> bytes:
+    """Return a stable digest of a Notion properties payload"""
+    canonical = orjson.dumps(properties, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+def _canonicalize_page_properties(properties: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert properties returned by Notion into the payload format we send"""
+    canonical = {}
+    for name, prop in properties.items():
+        if name not in MANAGED_PROPERTIES:
+            continue
+        prop_type = prop.get("type")
+        value = prop.get(prop_type)
+        if prop_type in ("title", "rich_text"):
+            text = "".join(item.get("plain_text", "") for item in value or [])
+            if text or prop_type == "title":
+                canonical[name] = _BUILDERS[prop_type](text)
+        elif prop_type == "select":
+            if value:
+                canonical[name] = _BUILDERS["select"](value["name"])
+        elif prop_type == "date":
+            if value and value.get("start"):
+                canonical[name] = {"date": {"start": value["start"]}}
+    return canonical
+
 class NotionTaskUploader:
     def __init__(self, api_key: str, database_id: str):
         """Initialize the Notion Task Uploader with API credentials"""
@@ -53,245 +194,344 @@ class NotionTaskUploader:
             "Notion-Version": "2022-06-28",
             "Content-Type": "application/json"
         }
-        self.existing_tasks = {}  # category -> notion_page_id mapping
+        self.existing_tasks = {}  # normalized category -> (notion_page_id, properties hash) mapping
+        self._client: Optional[httpx.AsyncClient] = None
     
     async def initialize(self):
-        """Fetch existing tasks to avoid duplicates"""
+        """Open the shared HTTP client and fetch existing tasks to avoid duplicates"""
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            http2=True,
+            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100),
+            timeout=30
+        )
         try:
             await self._fetch_existing_tasks()
-            print(f"Found {len(self.existing_tasks)} existing tasks in Notion database")
+            logger.info("Found %d existing tasks in Notion database", len(self.existing_tasks))
         except Exception as e:
-            print(f"Error initializing Notion uploader: {str(e)}")
+            logger.error("Error initializing Notion uploader: %s", e)
+            raise
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def __aenter__(self) -> "NotionTaskUploader":
+        """Initialize the uploader, closing the client again if that fails"""
+        try:
+            await self.initialize()
+        except Exception:
+            await self.aclose()
             raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        """Always release pooled connections on exit"""
+        await self.aclose()
+    
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+        retry_statuses: Collection[int] = RETRY_STATUS_CODES,
+        **kwargs
+    ) -> httpx.Response:
+        """Send a request, retrying responses in retry_statuses with exponential backoff"""
+        if payload is not None:
+            # Serialize once with orjson; the client already sends a JSON Content-Type
+            kwargs["content"] = orjson.dumps(payload)
+        for attempt in range(NOTION_MAX_RETRIES):
+            response = await self._client.request(method, url, **kwargs)
+            try:
+                response.raise_for_status()
+                return response
+            except httpx.HTTPStatusError:
+                if response.status_code not in retry_statuses or attempt == NOTION_MAX_RETRIES - 1:
+                    raise
+            
+            # Honor Retry-After when Notion provides it, otherwise back off exponentially
+            try:
+                retry_after = float(response.headers.get("Retry-After", 0))
+            except ValueError:
+                retry_after = 0
+            await asyncio.sleep(max(retry_after, 2 ** attempt * 0.5))
+    
+    async def _fetch_property_ids(self) -> List[str]:
+        """Look up the ids of the database properties managed by this script"""
+        response = await self._request("GET", f"{NOTION_API_BASE_URL}/databases/{self.database_id}")
+        properties = orjson.loads(response.content).get("properties", {})
+        # Notion returns ids percent-encoded; decode them so httpx encodes them only once
+        return [unquote(prop["id"]) for name, prop in properties.items() if name in MANAGED_PROPERTIES]
     
     async def _fetch_existing_tasks(self):
         """Query Notion database to get existing tasks"""
-        async with httpx.AsyncClient() as client:
-            url = f"{NOTION_API_BASE_URL}/databases/{self.database_id}/query"
-            has_more = True
-            start_cursor = None
-            
-            while has_more:
-                payload = {}
-                if start_cursor:
-                    payload["start_cursor"] = start_cursor
-                
-                response = await client.post(
-                    url,
-                    headers=self.headers,
-                    json=payload
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                # Process results
-                for page in data.get("results", []):
-                    properties = page.get("properties", {})
-                    category_property = properties.get("Category", {})
-                    title = category_property.get("title", [])
-                    
-                    if title and title[0].get("text", {}).get("content"):
-                        task_name = title[0]["text"]["content"]
-                        self.existing_tasks[task_name] = page["id"]
+        url = f"{NOTION_API_BASE_URL}/databases/{self.database_id}/query"
+        # Only request the properties we compare against to shrink each page
+        params = [("filter_properties", prop_id) for prop_id in await self._fetch_property_ids()]
+        
+        # Process results while the following page is in flight
+        async for results in self._iter_query_results(url, params):
+            for page in results:
+                properties = page.get("properties", {})
+                category_property = properties.get("Category", {})
+                title = category_property.get("title", [])
                 
-                # Check if there are more results
-                has_more = data.get("has_more", False)
-                if has_more:
-                    start_cursor = data.get("next_cursor")
+                # Long titles are split across several text objects
+                task_name = "".join(item.get("plain_text", "") for item in title)
+                if task_name:
+                    self.existing_tasks[_norm(task_name)] = (
+                        page["id"],
+                        _hash_properties(_canonicalize_page_properties(properties))
+                    )
     
-    async def create_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a new task in Notion"""
-        # Convert task data to Notion properties format
-        properties = self._convert_to_notion_properties(task_data)
+    async def _iter_query_results(self, url: str, params: List[Tuple[str, str]]) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield each page of query results, requesting the next page before yielding the current one"""
+        async def fetch(start_cursor: Optional[str]) -> Dict[str, Any]:
+            payload = {"page_size": NOTION_PAGE_SIZE}
+            if start_cursor:
+                payload["start_cursor"] = start_cursor
+            response = await self._request("POST", url, params=params, payload=payload)
+            return orjson.loads(response.content)
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{NOTION_API_BASE_URL}/pages",
-                headers=self.headers,
-                json={
-                    "parent": {"database_id": self.database_id},
-                    "properties": properties
-                }
-            )
-            
-            response.raise_for_status()
-            return response.json()
+        pending = asyncio.create_task(fetch(None))
+        try:
+            while pending is not None:
+                data = await pending
+                pending = None
+                
+                # Check if there are more results and start fetching them right away
+                if data.get("has_more", False) and data.get("next_cursor"):
+                    pending = asyncio.create_task(fetch(data["next_cursor"]))
+                yield data.get("results", [])
+        finally:
+            if pending is not None:
+                pending.cancel()
     
-    async def update_task(self, page_id: str, task_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Update an existing task in Notion"""
-        # Convert task data to Notion properties format
-        properties = self._convert_to_notion_properties(task_data)
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{NOTION_API_BASE_URL}/pages/{page_id}",
-                headers=self.headers,
-                json={"properties": properties}
-            )
-            
-            response.raise_for_status()
-            return response.json()
+    async def create_task(self, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a new task in Notion from a prebuilt properties payload"""
+        response = await self._request(
+            "POST",
+            f"{NOTION_API_BASE_URL}/pages",
+            payload={
+                "parent": {"database_id": self.database_id},
+                "properties": properties
+            },
+            retry_statuses=CREATE_RETRY_STATUS_CODES
+        )
+        return orjson.loads(response.content)
+    
+    async def update_task(self, page_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
+        """Update an existing task in Notion from a prebuilt properties payload"""
+        response = await self._request(
+            "PATCH",
+            f"{NOTION_API_BASE_URL}/pages/{page_id}",
+            payload={"properties": properties}
+        )
+        return orjson.loads(response.content)
+    
+    def prepare_task(self, task_data: Dict[str, Any]):
+        """Build a task's Notion properties and their hash once, for reuse by every upload path"""
+        task_data["_props"] = self._convert_to_notion_properties(task_data)
+        task_data["_hash"] = _hash_properties(task_data["_props"])
+    
+    def is_unchanged(self, key: str, task_data: Dict[str, Any]) -> bool:
+        """Check whether the existing Notion task for a normalized category already has these properties"""
+        _, existing_hash = self.existing_tasks[key]
+        return task_data["_hash"] == existing_hash
     
     def _convert_to_notion_properties(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert standardized task data to Notion properties format"""
-        properties = {}
+        properties = _TEMPLATE.copy()
         
-        # Handle Category/Task Name (Title field in Notion)
-        category = task_data.get("Category", "")
-        properties["Category"] = {
-            "title": [{"text": {"content": category}}]
-        }
-        
-        # Handle Sprint/Week/Milestone
-        sprint = task_data.get("Sprint", "")
-        if sprint:
-            properties["Sprint"] = {
-                "rich_text": [{"text": {"content": sprint}}]
-            }
-        
-        # Handle Task Description
-        description = task_data.get("Task Description", "")
-        if description:
-            properties["Task Description"] = {
-                "rich_text": [{"text": {"content": description}}]
-            }
+        # Category/Task Name is the title field in Notion
+        properties["Category"] = _BUILDERS["title"](task_data.get("Category", ""))
         
-        # Handle Tools/APIs Required
-        tools = task_data.get("Tools/APIs Required", "")
-        if tools:
-            properties["Tools/APIs Required"] = {
-                "rich_text": [{"text": {"content": tools}}]
-            }
+        for source_key, notion_field, notion_type, default in _FIELDS:
+            value = task_data.get(source_key, default)
+            if value:
+                properties[notion_field] = _BUILDERS[notion_type](value)
         
-        # Handle API/Tokens Required
-        api_tokens = task_data.get("API/Tokens Required", "")
-        if api_tokens:
-            properties["API/Tokens Required"] = {
-                "rich_text": [{"text": {"content": api_tokens}}]
-            }
+        # Drop properties that were empty or failed to build
+        return {name: prop for name, prop in properties.items() if prop is not None}
+
+def _iter_csv_rows(file_path: str) -> Iterator[Sequence[str]]:
+    """Yield the header row of a CSV file followed by each of its data rows"""
+    if pd is not None and os.path.getsize(file_path) >= PANDAS_MIN_FILE_SIZE:
+        # Large files are parsed in C, one chunk at a time, to keep memory flat
+        chunks = pd.read_csv(
+            file_path,
+            dtype=str,
+            chunksize=PANDAS_CHUNK_SIZE,
+            keep_default_na=False,
+            encoding='utf-8'
+        )
+        for i, chunk in enumerate(chunks):
+            if i == 0:
+                yield list(chunk.columns)
+            yield from chunk.itertuples(index=False, name=None)
+        return
+    
+    # utf-8-sig strips a leading BOM, matching pandas.read_csv
+    with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+        yield from csv.reader(f)
+
+def _read_csv_tasks(file_path: str) -> Iterator[Dict[str, Any]]:
+    """Yield standardized tasks from a CSV file one row at a time"""
+    rows = _iter_csv_rows(file_path)
+    header = next(rows, None)
+    if header is None:
+        return
+    
+    # Resolve each header's standardized name once per file; unmapped
+    # columns keep their original name
+    remap = [
+        (COLUMN_MAPPING.get(old_key, old_key), COLUMN_MAPPING.get(old_key) == "Notes/Comments")
+        for old_key in header
+    ]
+    
+    for row in rows:
+        # Standardize column names
+        task = {}
+        # Short rows are padded with "" so a present column never falls back to its default
+        for (new_key, is_notes), value in zip(remap, chain(row, repeat(""))):
+            # Append to existing value if it's Notes/Comments, ignoring empty cells
+            if is_notes and new_key in task:
+                if value:
+                    task[new_key] = f"{task[new_key]} | {value}" if task[new_key] else value
+            else:
+                task[new_key] = value
         
-        # Handle Status as a select field
-        status = task_data.get("Status", "Not Started")
-        if status:
-            properties["Status"] = {
-                "select": {"name": status}
-            }
+        # Skip empty tasks
+        if not task.get("Category"):
+            continue
         
-        # Handle Priority as a select field
-        priority = task_data.get("Priority", "Normal")
-        if priority:
-            properties["Priority"] = {
-                "select": {"name": priority}
-            }
+        yield task
+
+def _merge_task(existing: Dict[str, Any], task: Dict[str, Any]):
+    """Merge a duplicate task into the first task with the same category"""
+    for key, value in task.items():
+        # Keep the first occurrence's title; duplicates may differ in case or spacing
+        if not value or key == "Category":
+            continue
+        # Keep notes from every occurrence, later values win for other fields
+        if key == "Notes/Comments" and existing.get(key) and value != existing[key]:
+            existing[key] += f" | {value}"
+        else:
+            existing[key] = value
+
+async def iter_tasks(files: List[str]) -> AsyncIterator[Dict[str, Any]]:
+    """Stream standardized tasks from multiple CSV files, parsing them off the event loop"""
+    loop = asyncio.get_running_loop()
+    for file_path in files:
+        parsed: asyncio.Queue = asyncio.Queue()
         
-        # Handle Due Date as a date field
-        due_date = task_data.get("Due Date", "")
-        if due_date:
-            # Make sure date is in ISO format (YYYY-MM-DD)
+        def pump(path: str = file_path):
+            # Runs in a worker thread and hands each task back to the event loop;
+            # None marks the end of the file
             try:
-                if "-" not in due_date:
-                    # Try to parse MM/DD/YYYY format
-                    dt = datetime.strptime(due_date, "%m/%d/%Y")
-                    due_date = dt.strftime("%Y-%m-%d")
-                properties["Due Date"] = {
-                    "date": {"start": due_date}
-                }
-            except ValueError:
-                # If date parsing fails, don't add the property
-                pass
-        
-        # Handle Estimated Effort as a select field
-        effort = task_data.get("Estimated Effort", "")
-        if effort:
-            properties["Estimated Effort"] = {
-                "select": {"name": effort}
-            }
-        
-        # Handle Dependencies
-        dependencies = task_data.get("Dependencies", "")
-        if dependencies:
-            properties["Dependencies"] = {
-                "rich_text": [{"text": {"content": dependencies}}]
-            }
+                for task in _read_csv_tasks(path):
+                    loop.call_soon_threadsafe(parsed.put_nowait, task)
+            finally:
+                loop.call_soon_threadsafe(parsed.put_nowait, None)
         
-        # Handle Notes/Comments
-        notes = task_data.get("Notes/Comments", "")
-        if notes:
-            properties["Notes/Comments"] = {
-                "rich_text": [{"text": {"content": notes}}]
-            }
+        reader = asyncio.create_task(asyncio.to_thread(pump))
+        while (task := await parsed.get()) is not None:
+            yield task
         
-        return properties
+        try:
+            await reader
+        except Exception as e:
+            logger.error("Error processing file %s: %s", file_path, e)
+
+async def _report_progress(results: Dict[str, Any]):
+    """Log a one-line summary of upload progress every PROGRESS_INTERVAL seconds"""
+    while True:
+        await asyncio.sleep(PROGRESS_INTERVAL)
+        logger.info(
+            "Progress: %d created, %d updated, %d unchanged, %d errors (of %d tasks)",
+            results["created"], results["updated"], results["unchanged"], results["errors"], results["total"]
+        )
 
 async def process_csv_files(files: List[str], mode: str, uploader: NotionTaskUploader) -> Dict[str, Any]:
     """Process multiple CSV files and upload tasks to Notion"""
-    all_tasks = []
-    unique_categories = set()
-    
-    # Read and standardize all tasks from CSV files
-    for file_path in files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Standardize column names
-                    task = {}
-                    for old_key, value in row.items():
-                        if old_key in COLUMN_MAPPING:
-                            new_key = COLUMN_MAPPING[old_key]
-                            # Append to existing value if it's Notes/Comments
-                            if new_key == "Notes/Comments" and new_key in task and value:
-                                task[new_key] += f" | {value}"
-                            else:
-                                task[new_key] = value
-                        else:
-                            # Keep original key if not in mapping
-                            task[old_key] = value
-                    
-                    # Make sure we have a Category (Task Name)
-                    if "Category" not in task and "Task Name" in task:
-                        task["Category"] = task["Task Name"]
-                    
-                    # Skip empty tasks
-                    if not task.get("Category"):
-                        continue
-                    
-                    # Track unique categories to detect duplicates
-                    category = task.get("Category")
-                    if category in unique_categories:
-                        print(f"Warning: Duplicate task found: {category}")
-                    unique_categories.add(category)
-                    
-                    all_tasks.append(task)
-        except Exception as e:
-            print(f"Error processing file {file_path}: {str(e)}")
-    
-    # Upload to Notion based on mode
     results = {
-        "total": len(all_tasks),
+        "total": 0,
         "created": 0,
         "updated": 0,
+        "unchanged": 0,
         "errors": 0
     }
     
-    for task in all_tasks:
-        category = task.get("Category")
-        try:
-            if category in uploader.existing_tasks:
-                # Task exists - update if needed
-                if mode in ["update", "both"]:
-                    await uploader.update_task(uploader.existing_tasks[category], task)
-                    results["updated"] += 1
-                    print(f"Updated task: {category}")
+    async def run_wave(result_key: str, concurrency: int, uploads: List[Tuple[Dict[str, Any], Awaitable[Any]]]):
+        # Dispatch one endpoint's uploads concurrently within its own budget
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(task: Dict[str, Any], coro: Awaitable[Any]):
+            try:
+                async with semaphore:
+                    await coro
+            except Exception as e:
+                logger.error("Error processing task %s: %s", task["Category"], e)
+                results["errors"] += 1
             else:
-                # New task - create
-                if mode in ["create", "both"]:
-                    await uploader.create_task(task)
-                    results["created"] += 1
-                    print(f"Created task: {category}")
-        except Exception as e:
-            print(f"Error processing task {category}: {str(e)}")
-            results["errors"] += 1
+                results[result_key] += 1
+        
+        await asyncio.gather(*[run(task, coro) for task, coro in uploads])
+    
+    # Read all tasks, merging duplicate (normalized) categories so each is uploaded once
+    tasks_by_category: Dict[str, Dict[str, Any]] = {}
+    occurrences: Counter = Counter()
+    async for task in iter_tasks(files):
+        key = _norm(task["Category"])
+        occurrences[key] += 1
+        if key in tasks_by_category:
+            _merge_task(tasks_by_category[key], task)
+            continue
+        tasks_by_category[key] = task
+    results["total"] = len(tasks_by_category)
+    
+    # Warn about duplicates once, after ingestion
+    for key, count in occurrences.items():
+        if count > 1:
+            logger.warning("Duplicate task found %d times, merged: %s", count, tasks_by_category[key]["Category"])
+    
+    # Build payloads only after merging so each reflects every occurrence
+    for task in tasks_by_category.values():
+        uploader.prepare_task(task)
+    
+    # Classify every task once before any network work
+    to_create: List[Dict[str, Any]] = []
+    to_update: List[Tuple[str, Dict[str, Any]]] = []
+    for key, task in tasks_by_category.items():
+        if key in uploader.existing_tasks:
+            # Task exists - update if needed, skipping it when Notion already matches
+            if mode in ["update", "both"]:
+                if uploader.is_unchanged(key, task):
+                    results["unchanged"] += 1
+                else:
+                    page_id, _ = uploader.existing_tasks[key]
+                    to_update.append((page_id, task))
+        elif mode in ["create", "both"]:
+            # New task - create
+            to_create.append(task)
+    
+    reporter = asyncio.create_task(_report_progress(results))
+    try:
+        await run_wave(
+            "created",
+            NOTION_CREATE_CONCURRENCY,
+            [(task, uploader.create_task(task["_props"])) for task in to_create]
+        )
+        await run_wave(
+            "updated",
+            NOTION_UPDATE_CONCURRENCY,
+            [(task, uploader.update_task(page_id, task["_props"])) for page_id, task in to_update]
+        )
+    finally:
+        reporter.cancel()
     
     return results
 
@@ -305,6 +545,9 @@ async def main():
     parser.add_argument('--database-id', help='Notion database ID (or set NOTION_DATABASE_ID env var)')
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # httpx logs every request at INFO; keep output to our own progress lines
+    logging.getLogger("httpx").setLevel(logging.WARNING)
     
     # Get API key and database ID
     api_key = args.api_key or NOTION_API_KEY
@@ -319,18 +562,16 @@ async def main():
         return 1
     
     try:
-        # Initialize uploader
-        uploader = NotionTaskUploader(api_key, database_id)
-        await uploader.initialize()
-        
-        # Process CSV files
-        results = await process_csv_files(args.csv_files, args.mode, uploader)
+        # Initialize uploader and process CSV files over a single pooled connection
+        async with NotionTaskUploader(api_key, database_id) as uploader:
+            results = await process_csv_files(args.csv_files, args.mode, uploader)
         
         # Print summary
         print("\nUpload Summary:")
         print(f"Total tasks processed: {results['total']}")
         print(f"Tasks created: {results['created']}")
         print(f"Tasks updated: {results['updated']}")
+        print(f"Tasks unchanged: {results['unchanged']}")
         print(f"Errors: {results['errors']}")
         
         return 0
@@ -339,4 +580,4 @@ async def main():
         return 1
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
\ No newline at end of file
+    sys.exit(uvloop.run(main()) if uvloop else asyncio.run(main()))
\ No newline at end of file